@@ -323,11 +323,12 @@ class AutoFaqCrud(AutoFaqHTTPClient):
             }
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
-            json = model.model_dump()
+            data = model.to_json()
         resp = self.sync_request(
             'post',
             '/core-api/crud/api/v1/services',
-            json=json
+            data=data,
+            headers={'Content-Type': 'application/json'}
         ) 
         return {"result": resp, "errors": None}
         
@@ -366,11 +367,12 @@ class AutoFaqCrud(AutoFaqHTTPClient):
             }
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
-            json = model.model_dump()
+            data = model.to_json()
         resp = await self.async_request(
             'post',
             '/core-api/crud/api/v1/service',
-            json=json
+            data=data,
+            headers={'Content-Type': 'application/json'}
         ) 
         return {"result": resp, "errors": None}
         
@@ -749,11 +751,12 @@ class AutoFaqCrud(AutoFaqHTTPClient):
             }
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
-            json = model.model_dump()
+            data = model.to_json()
         resp = self.sync_request(
             'put',
             f'/core-api/crud/api/v1/services/{service_id}',
-            json=json
+            data=data,
+            headers={'Content-Type': 'application/json'}
         ) 
         return {"result": resp, "errors": None}
         
@@ -793,11 +796,12 @@ class AutoFaqCrud(AutoFaqHTTPClient):
             }
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
-            json = model.model_dump()
+            data = model.to_json()
         resp = await self.async_request(
             'put',
             f'/core-api/crud/api/v1/services/{service_id}',
-            json=json
+            data=data,
+            headers={'Content-Type': 'application/json'}
         ) 
         return {"result": resp, "errors": None}
     
@@ -2946,7 +2950,7 @@ class AutoFaqCrud(AutoFaqHTTPClient):
         Link: 
             https://app.swaggerhub.com/apis-docs/AutoFAQ.ai/aq_kb_crud/1.0#/Documents%20CRUD%20API/post_documents
         """
-        try: model = CreateDocumentRequest(**kwargs)
+        try: model = CreateDocumentRequest.fast_validate(kwargs)
         except ValidationError as e:
             return {
                 "result": None,
@@ -2981,7 +2985,7 @@ class AutoFaqCrud(AutoFaqHTTPClient):
         Link: 
             https://app.swaggerhub.com/apis-docs/AutoFAQ.ai/aq_kb_crud/1.0#/Documents%20CRUD%20API/post_documents
         """
-        try: model = CreateDocumentRequest(**kwargs)
+        try: model = CreateDocumentRequest.fast_validate(kwargs)
         except ValidationError as e:
             return {
                 "result": None,
@@ -3067,7 +3071,7 @@ class AutoFaqCrud(AutoFaqHTTPClient):
         Link: 
             https://app.swaggerhub.com/apis-docs/AutoFAQ.ai/aq_kb_crud/1.0#/Documents%20CRUD%20API/put_documents__document_id_
         """
-        try: model = UpdateDocumentRequest(**kwargs)
+        try: model = UpdateDocumentRequest.fast_validate(kwargs)
         except ValidationError as e:
             return {
                 "result": None,
@@ -3103,7 +3107,7 @@ class AutoFaqCrud(AutoFaqHTTPClient):
         Link: 
             https://app.swaggerhub.com/apis-docs/AutoFAQ.ai/aq_kb_crud/1.0#/Documents%20CRUD%20API/put_documents__document_id_
         """
-        try: model = UpdateDocumentRequest(**kwargs)
+        try: model = UpdateDocumentRequest.fast_validate(kwargs)
         except ValidationError as e:
             return {
                 "result": None,
@@ -3862,11 +3866,9 @@ class AutoFaqCrud(AutoFaqHTTPClient):
         
         Args:
             document_id (int) ID документа
-            limit_paraphrases (Optional[int])ограничение на количество формулировок в ответе
-            offset_paraphrases (Optional[int]) смещение на выдачу формулировок в ответе
-            offset (Optional[int]) pagination offset (default 0) (alias for offset_paraphrases)
-            count (Optional[int]) pagination count (default 9999) (alias for limit_paraphrases)
-            sort_by (Optional[str]) sort by 'id' or 'modified_at' (default is 'id')
+            offset (int) смещение на выдачу формулировок в ответе (default 0), можно передать как offset_paraphrases
+            count (int) ограничение на количество формулировок в ответе (default 9999), можно передать как limit_paraphrases
+            sort_by (Literal["id", "modified_at"]) sort by 'id' or 'modified_at' (default is 'id')
             sort_order (Literal["asc", "desc")] sorting order 'asc' or 'desc' (default is 'asc')
         
         Returns:
@@ -3897,11 +3899,9 @@ class AutoFaqCrud(AutoFaqHTTPClient):
         
         Args:
             document_id (int) ID документа
-            limit_paraphrases (Optional[int])ограничение на количество формулировок в ответе
-            offset_paraphrases (Optional[int]) смещение на выдачу формулировок в ответе
-            offset (Optional[int]) pagination offset (default 0) (alias for offset_paraphrases)
-            count (Optional[int]) pagination count (default 9999) (alias for limit_paraphrases)
-            sort_by (Optional[str]) sort by 'id' or 'modified_at' (default is 'id')
+            offset (int) смещение на выдачу формулировок в ответе (default 0), можно передать как offset_paraphrases
+            count (int) ограничение на количество формулировок в ответе (default 9999), можно передать как limit_paraphrases
+            sort_by (Literal["id", "modified_at"]) sort by 'id' or 'modified_at' (default is 'id')
             sort_order (Literal["asc", "desc")] sorting order 'asc' or 'desc' (default is 'asc')
         
         Returns:
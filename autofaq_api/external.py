@@ -571,11 +571,12 @@ class AutoFaqExternal(AutoFaqHTTPClient):
             }
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
-            json = model.model_dump()
+            data = model.model_dump_json()
         resp = self.sync_request(
             'post',
             f'/api/ext/v2/delayedDelivery',
-            json=json
+            data=data,
+            headers={'Content-Type': 'application/json'}
         ) 
         return {"result": resp, "errors": None}
     
@@ -607,11 +608,12 @@ class AutoFaqExternal(AutoFaqHTTPClient):
             }
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
-            json = model.model_dump()
+            data = model.model_dump_json()
         resp = await self.async_request(
             'post',
             f'/api/ext/v2/delayedDelivery',
-            json=json
+            data=data,
+            headers={'Content-Type': 'application/json'}
         )
         return {"result": resp, "errors": None}
     
@@ -67,7 +67,7 @@ class AutoFaqQuery(AutoFaqHTTPClient):
                 "results": None,
                 "errors": e.errors()
             }
-        resp = self.sync_request('post', '/core-api/query/api/v1/query', json=model.model_dump())
+        resp = self.sync_request('post', '/core-api/query/api/v1/query', data=model.model_dump_json(), headers={'Content-Type': 'application/json'})
         resp["errors"] = None
         return resp
     
@@ -122,7 +122,7 @@ class AutoFaqQuery(AutoFaqHTTPClient):
                 "results": None,
                 "errors": e.errors()
             }
-        resp = await self.async_request('post', '/core-api/query/api/v1/query', json=model.model_dump())
+        resp = await self.async_request('post', '/core-api/query/api/v1/query', data=model.model_dump_json(), headers={'Content-Type': 'application/json'})
         resp["errors"] = None
         return resp
     
@@ -173,7 +173,7 @@ class AutoFaqQuery(AutoFaqHTTPClient):
             return {
                 "results":  e.errors()
             }
-        resp = self.sync_request('post', '/core-api/query/api/v1/query/batch', json=model.model_dump()['payload'])
+        resp = self.sync_request('post', '/core-api/query/api/v1/query/batch', data=model.payload_json(), headers={'Content-Type': 'application/json'})
         return resp
     
     async def async_kb_batch(self, payload):
@@ -224,6 +224,6 @@ class AutoFaqQuery(AutoFaqHTTPClient):
             return {
                 "result": e.errors()
             }
-        resp = await self.async_request('post', '/core-api/query/api/v1/query/batch', json=model.model_dump()['payload'])
+        resp = await self.async_request('post', '/core-api/query/api/v1/query/batch', data=model.payload_json(), headers={'Content-Type': 'application/json'})
         return resp
     
@@ -0,0 +1,7 @@
+def _function() -> None:
+    pass
+
+
+# После сборки через Cython (модуль собирается вместе с моделями) методы становятся
+# cyfunction, а не FunctionType, и pydantic без ignored_types принимает их за поля без аннотации
+_FUNCTION_TYPES = (type(_function),)
@@ -1,8 +1,77 @@
 
+import re
+import sys
+
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
 from enum import Enum
-from pydantic import BaseModel, Field, field_validator, ConfigDict
-from typing import List, Optional, Dict, Any, Literal
+from pydantic import AfterValidator, AliasChoices, BaseModel, Field, SerializerFunctionWrapHandler, StringConstraints, TypeAdapter, ValidationInfo, ValidatorFunctionWrapHandler, WrapValidator, field_serializer, field_validator, model_validator, ConfigDict
+from typing import Annotated, List, Optional, Dict, Any, Literal, Final, Generator, Iterable, Iterator, Sequence, Union, overload
+
+from ._compat import _FUNCTION_TYPES
+
+
+_SKIP_VALIDATION: ContextVar[bool] = ContextVar('autofaq_skip_validation', default=False)
+
+
+@contextmanager
+def skip_validation() -> Generator[None, None, None]:
+    """
+    Отключение Python-валидаторов моделей для доверенных данных.
+
+    Внутри блока field_validator'ы с проверками сразу возвращают значение.
+    Ограничения Field (типы, длины, диапазоны) по-прежнему проверяет pydantic-core.
+
+    Examples:
+        >>> with skip_validation():
+        ...     documents = DocumentModel.validate_many(rows)
+    """
+    token = _SKIP_VALIDATION.set(True)
+    try:
+        yield
+    finally:
+        _SKIP_VALIDATION.reset(token)
+
+
+_MAX_QUESTION_LENGTH: Final[int] = 1000
+_MAX_SERVICE_NAME_LENGTH: Final[int] = 255
+_ISO_DATE_RE: Final[re.Pattern] = re.compile(r'^\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2})?)?')
+# Полная проверка типичного формата: такие даты всегда корректны, парсинг не нужен
+_ISO_DATETIME_FAST_RE: Final[re.Pattern] = re.compile(
+    r'(?!0000)\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|1\d|2[0-8])'
+    r'T(?:[01]\d|2[0-3]):[0-5]\d:[0-5]\d(?:\.\d{3}|\.\d{6})?'
+    r'(?:Z|[+-](?:[01]\d|2[0-3]):[0-5]\d)?',
+    re.ASCII
+)
+
+
+def _fromisoformat_compat(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+# С Python 3.11 datetime.fromisoformat сам принимает суффикс 'Z'
+_fromisoformat = datetime.fromisoformat if sys.version_info >= (3, 11) else _fromisoformat_compat
+
+
+# Общие строковые типы: одинаковые ограничения разделяют одну схему
+NonEmptyStr = Annotated[str, StringConstraints(min_length=1)]
+ShortStr = Annotated[str, StringConstraints(min_length=1, max_length=_MAX_SERVICE_NAME_LENGTH)]
+NameStr = Annotated[str, StringConstraints(min_length=1, max_length=500)]
+QuestionStr = Annotated[str, StringConstraints(min_length=1, max_length=_MAX_QUESTION_LENGTH)]
+TextStr = Annotated[str, StringConstraints(min_length=1, max_length=5000)]
+LongTextStr = Annotated[str, StringConstraints(min_length=1, max_length=10000)]
+
+
+def _check_opaque_dict(v: Any, handler: ValidatorFunctionWrapHandler) -> Any:
+    """Словарь принимается без обхода содержимого, остальное валидирует pydantic (и отклоняет не-словари)."""
+    if isinstance(v, dict):
+        return v
+    return handler(v)
+
+
+# Непрозрачные JSON-данные: проверяется только то, что это словарь, содержимое передается в API как есть
+OpaqueDict = Annotated[Dict[str, Any], WrapValidator(_check_opaque_dict)]
 
 
 class UserCreateModel(BaseModel):
@@ -44,19 +113,52 @@ class _HistoryAction(str, Enum):
     CS_CREATE_DOCUMENT = "cs_create_document"
     CS_DELETE_DOCUMENT = "cs_delete_document"
 
+_DOCUMENT_STATUS_BY_VALUE: Final[Dict[str, _DocumentStatus]] = {sys.intern(m.value): m for m in _DocumentStatus}
+_HISTORY_ACTION_BY_VALUE: Final[Dict[str, _HistoryAction]] = {sys.intern(m.value): m for m in _HistoryAction}
+
+_INTERNED_KEYS: Final = ('language', 'author')
+
+
+def _intern_short_strings(data: Any) -> Any:
+    """Интернирование строк из небольшого фиксированного словаря значений."""
+    if not isinstance(data, dict):
+        return data
+    interned = None
+    for key in _INTERNED_KEYS:
+        value = data.get(key)
+        if isinstance(value, str):
+            if interned is None:
+                interned = dict(data)
+            interned[key] = sys.intern(value)
+    return data if interned is None else interned
+
 class _AnswerModel(BaseModel):
     """Модель ответа на разных языках."""
     language: str = Field(..., description="Язык ответа", examples=["ru", "en"])
     text: str = Field(..., description="Текст ответа", examples=["Текст ответа на русском"])
 
+    @model_validator(mode='before')
+    @classmethod
+    def intern_strings(cls, data: Any) -> Any:
+        """Интернирование коротких строковых значений."""
+        return _intern_short_strings(data)
+
 class _ParaphraseModel(BaseModel):
     """Модель перефразировки вопроса."""
+    model_config = ConfigDict(frozen=True, extra='forbid')
     paraphrase_id: int = Field(..., ge=0, description="ID перефразировки")
     text: str = Field(..., description="Текст перефразировки", examples=["Как приобрести собаку"])
     author: str = Field(..., description="Автор перефразировки", examples=["auto", "operator"])
 
+    @model_validator(mode='before')
+    @classmethod
+    def intern_strings(cls, data: Any) -> Any:
+        """Интернирование коротких строковых значений."""
+        return _intern_short_strings(data)
+
 class _AttachmentModel(BaseModel):
     """Модель вложения документа."""
+    model_config = ConfigDict(frozen=True, extra='forbid')
     attachment_id: int = Field(..., ge=0, description="ID вложения")
     name: str = Field(..., description="Название вложения")
     description: Optional[str] = Field(None, description="Описание вложения")
@@ -79,57 +181,221 @@ class _HistoryItemModel(BaseModel):
     user: _UserModel = Field(..., description="Пользователь, выполнивший действие")
     changelist: List[_ChangeItemModel] = Field(..., description="Список изменений")
 
+class _HistoryColumns(Sequence[_HistoryItemModel]):
+    """
+    Колоночное представление истории изменений документа.
+
+    Хранит историю как набор параллельных списков вместо списка моделей
+    _HistoryItemModel. Элементы _HistoryItemModel создаются только при обращении
+    по индексу или итерации.
+    """
+    __slots__ = ('name', 'created_at', 'user_id', 'user_name', 'user_email', 'changelist')
+
+    def __init__(self) -> None:
+        self.name: List[str] = []
+        self.created_at: List[str] = []
+        self.user_id: List[str] = []
+        self.user_name: List[str] = []
+        self.user_email: List[str] = []
+        self.changelist: List[List[Dict[str, Any]]] = []
+
+    @classmethod
+    def from_items(cls, items: Iterable[Dict[str, Any]]) -> "_HistoryColumns":
+        """
+        Сборка колонок из доверенных элементов истории без валидации.
+
+        Args:
+            items (Iterable[Dict[str, Any]]): Элементы истории изменений
+
+        Returns:
+            _HistoryColumns: История в колоночном виде
+        """
+        columns = cls()
+        for item in items:
+            user = item['user']
+            columns.name.append(item['name'])
+            columns.created_at.append(item['created_at'])
+            columns.user_id.append(user['id'])
+            columns.user_name.append(user['name'])
+            columns.user_email.append(user['email'])
+            columns.changelist.append(list(item.get('changelist', ())))
+        return columns
+
+    def _item(self, i: int) -> _HistoryItemModel:
+        name = self.name[i]
+        return _HistoryItemModel.model_construct(
+            name=_HISTORY_ACTION_BY_VALUE.get(name, name),
+            created_at=self.created_at[i],
+            user=_UserModel.model_construct(id=self.user_id[i], name=self.user_name[i], email=self.user_email[i]),
+            changelist=[_ChangeItemModel.model_construct(**c) for c in self.changelist[i]],
+        )
+
+    def __len__(self) -> int:
+        return len(self.name)
+
+    @overload
+    def __getitem__(self, index: int) -> _HistoryItemModel: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[_HistoryItemModel]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[_HistoryItemModel, List[_HistoryItemModel]]:
+        if isinstance(index, slice):
+            return [self._item(i) for i in range(*index.indices(len(self)))]
+        return self._item(index)
+
+    def __iter__(self) -> Iterator[_HistoryItemModel]:
+        for i in range(len(self)):
+            yield self._item(i)
+
+    def __repr__(self) -> str:
+        return f"_HistoryColumns(len={len(self)})"
+
+    def as_dicts(self) -> List[Dict[str, Any]]:
+        """Элементы истории в виде словарей для сериализации."""
+        return [
+            {
+                'name': name,
+                'created_at': created_at,
+                'user': {'id': user_id, 'name': user_name, 'email': user_email},
+                'changelist': changelist,
+            }
+            for name, created_at, user_id, user_name, user_email, changelist in zip(
+                self.name, self.created_at, self.user_id, self.user_name, self.user_email, self.changelist
+            )
+        ]
+
 class DocumentModel(BaseModel):
     """Модель документа для сервиса."""
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True, extra='forbid', ignored_types=_FUNCTION_TYPES)
     document_id: int = Field(..., ge=0, description="ID документа")
     name: str = Field(..., description="Название документа", examples=["Документ о покупке животных"])
-    question: str = Field(..., min_length=1, max_length=1000, description="Текст вопроса", examples=["Как купить собаку"])
-    answer: str = Field(..., min_length=1, description="Текст ответа", examples=["Для покупки собаки обратитесь к консультанту"])
+    question: QuestionStr = Field(..., description="Текст вопроса", examples=["Как купить собаку"])
+    answer: NonEmptyStr = Field(..., description="Текст ответа", examples=["Для покупки собаки обратитесь к консультанту"])
     status: _DocumentStatus = Field(..., description="Статус документа")
     modified_at: str = Field(..., description="Дата и время последнего изменения")
     expired_at: Optional[str] = Field(None, description="Дата и время истечения срока действия")
-    ext: Dict[str, Any] = Field(default_factory=dict, description="Дополнительные данные")
+    ext: OpaqueDict = Field(default_factory=dict, description="Дополнительные данные")
     paraphrases_count: int = Field(0, ge=0, description="Количество перефразировок")
     suggested_paraphrases_count: int = Field(0, ge=0, description="Количество предложенных перефразировок")
     paraphrases: List[_ParaphraseModel] = Field(default_factory=list, description="Список перефразировок")
     attachments: List[_AttachmentModel] = Field(default_factory=list, description="Список вложений")
-    context: Dict[str, Any] = Field(default_factory=dict, description="Контекст документа")
+    context: OpaqueDict = Field(default_factory=dict, description="Контекст документа")
     answers: List[_AnswerModel] = Field(default_factory=list, description="Ответы на разных языках")
-    history: List[_HistoryItemModel] = Field(default_factory=list, description="История изменений документа")
+    history: Sequence[_HistoryItemModel] = Field(default_factory=list, description="История изменений документа")
 
-    @field_validator('question')
-    @classmethod
-    def validate_question_length(cls, v: str) -> str:
-        """Валидация длины вопроса."""
-        if len(v.strip()) == 0:
-            raise ValueError("Вопрос не может быть пустым")
-        if len(v) > 1000:
-            raise ValueError("Вопрос не должен превышать 1000 символов")
-        return v.strip()
-
-    @field_validator('answer')
-    @classmethod
-    def validate_answer_length(cls, v: str) -> str:
-        """Валидация длины ответа."""
-        if len(v.strip()) == 0:
-            raise ValueError("Ответ не может быть пустым")
-        return v.strip()
+    @field_serializer('history', mode='wrap')
+    def serialize_history(self, v: Any, handler: SerializerFunctionWrapHandler) -> Any:
+        """Колоночная история из from_trusted сериализуется так же, как список элементов."""
+        if isinstance(v, _HistoryColumns):
+            return v.as_dicts()
+        return handler(v)
 
     @field_validator('modified_at', 'expired_at')
     @classmethod
     def validate_date_format(cls, v: Optional[str]) -> Optional[str]:
         """Валидация формата даты."""
-        if v is None:
+        if v is None or _SKIP_VALIDATION.get():
             return v
+        if _ISO_DATETIME_FAST_RE.fullmatch(v):
+            return v
+        if not _ISO_DATE_RE.match(v):
+            raise ValueError("Неверный формат даты. Ожидается ISO 8601")
         try:
-            datetime.fromisoformat(v.replace('Z', '+00:00'))
+            _fromisoformat(v)
             return v
         except ValueError:
             raise ValueError("Неверный формат даты. Ожидается ISO 8601")
 
+    @classmethod
+    def validate_many(cls, data: List[Dict[str, Any]]) -> List["DocumentModel"]:
+        """
+        Валидация списка документов одним вызовом pydantic-core.
+
+        Args:
+            data (List[Dict[str, Any]]): Список данных документов
+
+        Returns:
+            List[DocumentModel]: Список провалидированных документов
+        """
+        return _DOCUMENTS_ADAPTER.validate_python(data)
+
+    def to_json(self) -> bytes:
+        """
+        Сериализация документа в JSON напрямую через pydantic-core.
+
+        Returns:
+            bytes: JSON документа без полей со значением None
+        """
+        return self.__pydantic_serializer__.to_json(self, exclude_none=True, by_alias=True)
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any], columnar_history: bool = False) -> "DocumentModel":
+        """
+        Сборка документа из доверенных данных без валидации.
+
+        Используется только для данных, уже прошедших валидацию (например,
+        полученных от API AutoFAQ). Пользовательский ввод валидируется
+        обычным конструктором.
+
+        Args:
+            data (Dict[str, Any]): Данные документа
+            columnar_history (bool): Хранить историю в колоночном виде (_HistoryColumns)
+
+        Returns:
+            DocumentModel: Документ со вложенными моделями
+        """
+        history: Sequence[_HistoryItemModel]
+        if columnar_history:
+            history = _HistoryColumns.from_items(data.get('history', ()))
+        else:
+            history = [
+                _HistoryItemModel.model_construct(**{
+                    **item,
+                    'name': _HISTORY_ACTION_BY_VALUE.get(item['name'], item['name']),
+                    'user': _UserModel.model_construct(**item['user']),
+                    'changelist': [_ChangeItemModel.model_construct(**c) for c in item.get('changelist', ())],
+                })
+                for item in data.get('history', ())
+            ]
+        return cls.model_construct(**{
+            **data,
+            'status': _DOCUMENT_STATUS_BY_VALUE.get(data['status'], data['status']),
+            'paraphrases': [_ParaphraseModel.model_construct(**p) for p in data.get('paraphrases', ())],
+            'attachments': [_AttachmentModel.model_construct(**a) for a in data.get('attachments', ())],
+            'answers': [_AnswerModel.model_construct(**a) for a in data.get('answers', ())],
+            'history': history,
+        })
+
+_DOCUMENTS_ADAPTER: Final[TypeAdapter[List[DocumentModel]]] = TypeAdapter(List[DocumentModel])
+
+
+def _check_unique_documents(v: List[DocumentModel]) -> List[DocumentModel]:
+    """Проверка уникальности document_id и вопросов за один проход."""
+    if _SKIP_VALIDATION.get():
+        return v
+    seen_ids: set[int] = set()
+    seen_questions: set[str] = set()
+    add_id = seen_ids.add
+    add_question = seen_questions.add
+    for doc in v:
+        if doc.document_id in seen_ids:
+            raise ValueError("Document IDs должны быть уникальными")
+        add_id(doc.document_id)
+
+        question = doc.question.lower().strip()
+        if question in seen_questions:
+            raise ValueError("Вопросы должны быть уникальными")
+        add_question(question)
+
+    return v
+
+
+UniqueDocuments = Annotated[List[DocumentModel], AfterValidator(_check_unique_documents)]
+
 class ServiceCreateModel(BaseModel):
-    model_config = ConfigDict(str_strip_whitespace=True, use_enum_values=True)
-    name: str = Field(..., min_length=1, max_length=255, description="Название сервиса")
+    model_config = ConfigDict(str_strip_whitespace=True, use_enum_values=True, ignored_types=_FUNCTION_TYPES)
+    name: ShortStr = Field(..., description="Название сервиса")
     preset: _LanguagePreset = Field(default=_LanguagePreset.RU, description="Языковой пресет для обработки текста")
     trainable: bool = Field(default=True, description="Возможность обучения модели на данных сервиса") 
     max_trainable_score: float = Field(default=0.95, ge=0.0, le=1.0, description="Максимальный порог обучаемости модели (0.0-1.0)")
@@ -142,61 +408,61 @@ class ServiceCreateModel(BaseModel):
     inequal_lang_penalty: float = Field(default=0.0, ge=0.0, le=1.0, description="Штраф за разные языки в запросе и ответе (0.0-1.0)")
     without_validation: bool = Field(default=False, description="Создание сервиса без валидации данных")
     with_layout_correction: bool = Field(default=True, description="Коррекция layout'а текста")
-    ext: Dict[str, Any] = Field(default_factory=dict, description="Дополнительные параметры сервиса в формате ключ-значение") 
-    documents: List[DocumentModel] = Field(default_factory=list, description="Список документов сервиса")
+    ext: OpaqueDict = Field(default_factory=dict, description="Дополнительные параметры сервиса в формате ключ-значение") 
+    documents: UniqueDocuments = Field(default_factory=list, description="Список документов сервиса")
 
     @field_validator('name')
     @classmethod
     def validate_name(cls, v: str) -> str:
         """Валидация названия сервиса."""
+        if _SKIP_VALIDATION.get():
+            return v
         v = v.strip()
         if len(v) == 0:
             raise ValueError("Название сервиса не может быть пустым")
-        if len(v) > 255:
-            raise ValueError("Название сервиса не должно превышать 255 символов")
+        if len(v) > _MAX_SERVICE_NAME_LENGTH:
+            raise ValueError(f"Название сервиса не должно превышать {_MAX_SERVICE_NAME_LENGTH} символов")
         return v
 
     @field_validator('max_trainable_score')
     @classmethod
-    def validate_trainable_score(cls, v: float, values) -> float:
+    def validate_trainable_score(cls, v: float, info: ValidationInfo) -> float:
         """Валидация порога обучаемости."""
-        if 'trainable' in values and not values['trainable'] and v > 0:
+        if not _SKIP_VALIDATION.get() and 'trainable' in info.data and not info.data['trainable'] and v > 0:
             raise ValueError("Порог обучаемости должен быть 0 при trainable=false")
         return round(v, 2)
 
-    @field_validator('documents')
-    @classmethod
-    def validate_documents(cls, v: List[DocumentModel]) -> List[DocumentModel]:
-        """Валидация списка документов."""
-        if not v:
-            return v
-        
-        # Проверка уникальности document_id
-        document_ids = [doc.document_id for doc in v]
-        if len(document_ids) != len(set(document_ids)):
-            raise ValueError("Document IDs должны быть уникальными")
-        
-        # Проверка уникальности вопросов
-        questions = [doc.question.lower().strip() for doc in v]
-        if len(questions) != len(set(questions)):
-            raise ValueError("Вопросы должны быть уникальными")
-        
-        return v
-
     @field_validator('inequal_lang_penalty')
     @classmethod
     def validate_penalty(cls, v: float) -> float:
         """Валидация штрафа за разные языки."""
         return round(v, 2)
 
-    def model_dump(self, **kwargs) -> dict:
+    def to_json(self) -> bytes:
         """
-        Сериализация модели в словарь.
-        
+        Сериализация сервиса в JSON напрямую через pydantic-core.
+
+        Returns:
+            bytes: JSON сервиса без полей со значением None
+        """
+        return self.__pydantic_serializer__.to_json(self, exclude_none=True, by_alias=True)
+
+    @classmethod
+    def from_trusted(cls, data: Dict[str, Any], columnar_history: bool = False) -> "ServiceCreateModel":
+        """
+        Сборка сервиса из доверенных данных без валидации.
+
+        Args:
+            data (Dict[str, Any]): Данные сервиса
+            columnar_history (bool): Хранить историю документов в колоночном виде (_HistoryColumns)
+
         Returns:
-            dict: Сериализованные данные сервиса
+            ServiceCreateModel: Сервис со списком документов
         """
-        return super().model_dump(**kwargs)
+        return cls.model_construct(**{
+            **data,
+            'documents': [DocumentModel.from_trusted(d, columnar_history) for d in data.get('documents', ())],
+        })
     
 class ServicesGetModel(BaseModel):
     """
@@ -210,7 +476,7 @@ class ServicesGetModel(BaseModel):
     """ 
     offset: int = Field(default=0, ge=0, description="Смещение (количество записей для пропуска)")
     count: int = Field(default=9999, ge=1, le=10000, description="Количество записей для возврата")
-    sort_by: str = Field(default="id", min_length=1, escription="Поле для сортировки")
+    sort_by: str = Field(default="id", min_length=1, description="Поле для сортировки")
     sort_order: Literal["asc", "desc"] = Field(default="asc", description="Порядок сортировки")
 
 class ServiceIdsModel(BaseModel):
@@ -227,15 +493,16 @@ class ServiceGetModel(BaseModel):
     Модель параметров для получения определенного БЗ
     
     Attributes:
-        include_documents (int): Включать документы со статусом рекомендации
-        include_suggested (int): Лимит перефразировок на документ
-        limit_paraphrases (int): Лимит истории изменений документа
+        include_documents (int): Возвращать список документов
+        include_suggested (int): Включать документы со статусом рекомендации
+        limit_paraphrases (int): Лимит перефразировок на документ
+        limit_history (int): Лимит истории изменений документа
     """
     
     include_documents: int = Field(default=0, ge=0, le=1, description="Возвращать список документов (1 - да, 0 - нет)")
     include_suggested: int = Field(default=0, ge=0, le=1, description="Включать в список документы со статусом рекомендации (1 - да, 0 - нет)")
-    include_suggested: int = Field(default=500000, ge=0, le=1000000, description="Лимит количества перефразировок на документ")
-    limit_paraphrases: int = Field(default=100, ge=1, le=10000,description="Лимит размера истории изменений документа")
+    limit_paraphrases: int = Field(default=500000, ge=0, le=1000000, description="Лимит количества перефразировок на документ")
+    limit_history: int = Field(default=100, ge=1, le=10000,description="Лимит размера истории изменений документа")
     
     
 class ServiceDocumentsGetModel(BaseModel):
@@ -254,7 +521,7 @@ class ServiceDocumentsGetModel(BaseModel):
     
     offset: int = Field(default=0, ge=0, le=100000, description="Смещение для пагинации (количество документов для пропуска)")
     count: int = Field( default=1000, ge=1, le=10000, description="Количество документов для возврата")
-    sort_by: str = Field(default="id", min_length=1, escription="Поле для сортировки документов")
+    sort_by: str = Field(default="id", min_length=1, description="Поле для сортировки документов")
     sort_order: Literal["asc", "desc"] = Field(default="asc", description="Порядок сортировки документов")
     limit_paraphrases: int = Field(default=500000, ge=0, le=1000000, description="Лимит количества перефразировок на документ")
     limit_history: int = Field(default=100, ge=1, le=10000, description="Лимит размера истории изменений документа")
@@ -262,29 +529,52 @@ class ServiceDocumentsGetModel(BaseModel):
     
     
     
-class SuggestedDocumentsParamsModel(BaseModel):
+class _SuggestedRangeParams(BaseModel):
     """
-    Модель валидации query-параметров для эндпоинта получения предлагаемых документов.
+    Общие query-параметры интервала для эндпоинтов предлагаемых документов и формулировок.
     
     Attributes:
         from_time: Начало интервала в формате ISO timestamp (по умолчанию - 1 день назад)
         to: Конец интервала в формате ISO timestamp (по умолчанию - сегодня)
         limit: Лимит выводимых элементов (приоритет над count)
+    """
+    from_time: Optional[str] = Field(default=None, alias="from", description="Начало интервала ISO timestamp по умолчанию - 1 день назад")
+    to: Optional[str] = Field(default=None, description="Конец интервала ISO timestamp по умолчанию - сегодня" )
+    limit: Optional[int] = Field(default=None, ge=1, description="Лимит выводимых элементов" )
+
+
+class _SuggestedListParams(_SuggestedRangeParams):
+    """
+    Общие query-параметры интервала и пагинации для эндпоинтов списков предлагаемых документов и формулировок.
+    
+    Attributes:
         offset: Смещение для пагинации (по умолчанию 0)
         count: Количество элементов для пагинации (alias для limit, по умолчанию 9999)
         sort_by: Поле для сортировки - 'id' или 'modified_at' (по умолчанию 'id')
         sort_order: Порядок сортировки - 'asc' или 'desc' (по умолчанию 'asc')
     """
-    from_time: Optional[str] = Field(default=None, alias="from", description="Начало интервала ISO timestamp по умолчанию - 1 день назад")
-    to: Optional[str] = Field(default=None, description="Конец интервала ISO timestamp по умолчанию - сегодня" )
-    limit: Optional[int] = Field(default=None, ge=1, description="Лимит выводимых элементов" )
     offset: Optional[int] = Field(default=0, ge=0, description="Смещение для пагинации (по умолчанию 0)" )
     count: Optional[int] = Field(default=None, ge=1, description="Количество элементов для пагинации (по умолчанию 9999)")
     sort_by: Optional[str] = Field( default="id", description="Поле для сортировки - 'id' или 'modified_at' (по умолчанию 'id')")
     sort_order: Literal["asc", "desc"] = Field(default="asc", description="Порядок сортировки - 'asc' или 'desc' (по умолчанию 'asc')" )
+
+
+class SuggestedDocumentsParamsModel(_SuggestedListParams):
+    """
+    Модель валидации query-параметров для эндпоинта получения предлагаемых документов.
+    
+    Attributes:
+        from_time: Начало интервала в формате ISO timestamp (по умолчанию - 1 день назад)
+        to: Конец интервала в формате ISO timestamp (по умолчанию - сегодня)
+        limit: Лимит выводимых элементов (приоритет над count)
+        offset: Смещение для пагинации (по умолчанию 0)
+        count: Количество элементов для пагинации (alias для limit, по умолчанию 9999)
+        sort_by: Поле для сортировки - 'id' или 'modified_at' (по умолчанию 'id')
+        sort_order: Порядок сортировки - 'asc' или 'desc' (по умолчанию 'asc')
+    """
     
 
-class SuggestedDocumentsCountParamsModel(BaseModel):
+class SuggestedDocumentsCountParamsModel(_SuggestedRangeParams):
     """
     Модель валидации query-параметров для эндпоинта получения количества предлагаемых документов.
     
@@ -293,12 +583,9 @@ class SuggestedDocumentsCountParamsModel(BaseModel):
         to: Конец интервала в формате ISO timestamp (по умолчанию - сегодня)
         limit: Лимит выводимых элементов (приоритет над count)
     """
-    from_time: Optional[str] = Field(default=None, alias="from", description="Начало интервала ISO timestamp по умолчанию - 1 день назад")
-    to: Optional[str] = Field(default=None, description="Конец интервала ISO timestamp по умолчанию - сегодня" )
-    limit: Optional[int] = Field(default=None, ge=1, description="Лимит выводимых элементов" )
     
 
-class SuggestedParaphrasesParamsModel(BaseModel):
+class SuggestedParaphrasesParamsModel(_SuggestedListParams):
     """
     Модель валидации query-параметров для эндпоинта получения предлагаемых формулировок.
     
@@ -311,16 +598,9 @@ class SuggestedParaphrasesParamsModel(BaseModel):
         sort_by: Поле для сортировки - 'id' или 'modified_at' (по умолчанию 'id')
         sort_order: Порядок сортировки - 'asc' или 'desc' (по умолчанию 'asc')
     """
-    from_time: Optional[str] = Field(default=None, alias="from", description="Начало интервала ISO timestamp по умолчанию - 1 день назад")
-    to: Optional[str] = Field(default=None, description="Конец интервала ISO timestamp по умолчанию - сегодня" )
-    limit: Optional[int] = Field(default=None, ge=1, description="Лимит выводимых элементов" )
-    offset: Optional[int] = Field(default=0, ge=0, description="Смещение для пагинации (по умолчанию 0)" )
-    count: Optional[int] = Field(default=None, ge=1, description="Количество элементов для пагинации (по умолчанию 9999)")
-    sort_by: Optional[str] = Field( default="id", description="Поле для сортировки - 'id' или 'modified_at' (по умолчанию 'id')")
-    sort_order: Literal["asc", "desc"] = Field(default="asc", description="Порядок сортировки - 'asc' или 'desc' (по умолчанию 'asc')" )
     
     
-class SuggestedParaphrasesCountParamsModel(BaseModel):
+class SuggestedParaphrasesCountParamsModel(_SuggestedRangeParams):
     """
     Модель валидации query-параметров для эндпоинта получения количества предлагаемых рекомендаций.
     
@@ -329,9 +609,6 @@ class SuggestedParaphrasesCountParamsModel(BaseModel):
         to: Конец интервала в формате ISO timestamp (по умолчанию - сегодня)
         limit: Лимит выводимых элементов (приоритет над count)
     """
-    from_time: Optional[str] = Field(default=None, alias="from", description="Начало интервала ISO timestamp по умолчанию - 1 день назад")
-    to: Optional[str] = Field(default=None, description="Конец интервала ISO timestamp по умолчанию - сегодня" )
-    limit: Optional[int] = Field(default=None, ge=1, description="Лимит выводимых элементов" )
     
 
 class SuggestedDocumentsValidateModel(BaseModel):
@@ -343,6 +620,7 @@ class SuggestedDocumentsValidateModel(BaseModel):
         to: Конец интервала в формате ISO timestamp  
         document_ids: Список идентификаторов документов для проверки
     """
+    model_config = ConfigDict(defer_build=True)
     from_time: Optional[str] = Field(default=None, alias="from", description="начало интервала ISO timestamp")
     to: Optional[str] = Field(default=None, description="конец интервала ISO timestamp")
     document_ids: List[int] = Field(..., description="список идентификаторов документов для проверки")
@@ -376,7 +654,8 @@ class ServicesValidationsModel(BaseModel):
         min_confidence: Минимальный общий уровень уверенности (по умолчанию 0.95)
         min_answer_confidence: Минимальный уровень уверенности для ответов (по умолчанию 0.9)
     """
-    service_ids: List[int] = Field(..., min_items=1, description="список идентификаторов сервисов для проверки")
+    model_config = ConfigDict(defer_build=True)
+    service_ids: List[int] = Field(..., min_length=1, description="список идентификаторов сервисов для проверки")
     min_confidence: float = Field(default=0.95, ge=0.0, le=1.0, description="минимальный общий уровень уверенности (по умолчанию 0.95)")
     min_answer_confidence: float = Field(default=0.9, ge=0.0, le=1.0, description="минимальный уровень уверенности для ответов (по умолчанию 0.9)")
     
@@ -389,7 +668,7 @@ class UpdateServiceAttachmentModel(BaseModel):
         name: Название вложения (обязательное поле)
         description: Описание вложения (опциональное поле)
     """
-    name: str = Field(..., min_length=1, max_length=255, description="название вложения")
+    name: ShortStr = Field(..., description="название вложения")
     description: Optional[str] = Field(default=None, max_length=1000, description="описание вложения")
     
     
@@ -407,8 +686,9 @@ class _GuidelineItem(BaseModel):
         id: Идентификатор руководства
         text: Текст руководства
     """
+    model_config = ConfigDict(defer_build=True)
     id: int = Field(..., ge=0, description="идентификатор руководства")
-    text: str = Field(..., min_length=1, description="текст руководства")
+    text: NonEmptyStr = Field(..., description="текст руководства")
 
 
 class _QAItem(BaseModel):
@@ -421,10 +701,11 @@ class _QAItem(BaseModel):
         question: Текст вопроса
         answer: Текст ответа
     """
+    model_config = ConfigDict(defer_build=True)
     id: int = Field(..., ge=0, description="идентификатор QA")
     type: _QAType = Field(..., description="тип QA - 'standard' или 'clarifying'")
-    question: str = Field(..., min_length=1, description="текст вопроса")
-    answer: str = Field(..., min_length=1, description="текст ответа")
+    question: NonEmptyStr = Field(..., description="текст вопроса")
+    answer: NonEmptyStr = Field(..., description="текст ответа")
 
 
 class _EnabledParts(BaseModel):
@@ -437,6 +718,7 @@ class _EnabledParts(BaseModel):
         standard_qa: Включены ли стандартные QA
         clarifying_qa: Включены ли уточняющие QA
     """
+    model_config = ConfigDict(defer_build=True)
     heading: bool = Field(..., description="включена ли заголовочная часть")
     guidelines: bool = Field(..., description="включены ли руководства")
     standard_qa: bool = Field(..., description="включены ли стандартные QA")
@@ -453,6 +735,7 @@ class ServicePromptModel(BaseModel):
         qa: Список вопросов-ответов
         enabled_parts: Настройки включенных частей промпта
     """
+    model_config = ConfigDict(defer_build=True)
     heading: Optional[str] = Field(default=None, max_length=1000, description="заголовок промпта" )
     guidelines: Optional[List[_GuidelineItem]] = Field(default=None, description="список руководств")
     qa: Optional[List[_QAItem]] = Field(default=None, description="список вопросов-ответов")
@@ -469,10 +752,11 @@ class ServicePromptQAModel(BaseModel):
         question: Текст вопроса
         answer: Текст ответа
     """
+    model_config = ConfigDict(defer_build=True)
     id: int = Field(0, ge=0, description="идентификатор QA (должен быть 0 для создания нового)")
     type: _QAType = Field(None, description="тип QA - 'standard' или 'clarifying'")
-    question: str = Field(None, min_length=1, max_length=5000, description="текст вопроса")
-    answer: str = Field(None, min_length=1, max_length=10000, description="текст ответа")
+    question: TextStr = Field(None, description="текст вопроса")
+    answer: LongTextStr = Field(None, description="текст ответа")
    
     
 class _ParaphraseItem(BaseModel):
@@ -483,8 +767,8 @@ class _ParaphraseItem(BaseModel):
         text: Текст парафраза
     """
     paraphrase_id: int = Field(None, ge=0, description="ID парафраза")
-    text: str = Field(None, min_length=1, description="текст парафраза")
-    author: str = Field(None, min_length=1, description="автор парафраза")
+    text: NonEmptyStr = Field(None, description="текст парафраза")
+    author: NonEmptyStr = Field(None, description="автор парафраза")
     
 
 class CreateDocumentRequest(BaseModel):
@@ -501,14 +785,27 @@ class CreateDocumentRequest(BaseModel):
         paraphrases: Список парафразов (вариаций вопроса)
     """
     service_id: int = Field(..., gt=0, description="ID сервиса, к которому принадлежит документ")
-    name: str = Field(...,  min_length=1, max_length=500, description="название документа")
-    question: str = Field(..., min_length=1, max_length=5000, description="основной вопрос документа")
-    answer: str = Field(..., min_length=1, max_length=10000, description="ответ на вопрос")
+    name: NameStr = Field(..., description="название документа")
+    question: TextStr = Field(..., description="основной вопрос документа")
+    answer: LongTextStr = Field(..., description="ответ на вопрос")
     status: _DocumentStatus = Field(default=_DocumentStatus.OK, description="статус документа")
     ext: Optional[Dict[str, Any]] = Field(default_factory=dict, description="дополнительные данные в формате JSON")
     paraphrases: Optional[List[_ParaphraseItem]] = Field(default=None, description="список парафразов (вариаций вопроса)")
-    
-    
+
+    @classmethod
+    def fast_validate(cls, data: Dict[str, Any]) -> "CreateDocumentRequest":
+        """
+        Валидация запроса через заранее собранный TypeAdapter.
+
+        Args:
+            data (Dict[str, Any]): Параметры запроса
+
+        Returns:
+            CreateDocumentRequest: Провалидированный запрос
+        """
+        return _CREATE_DOCUMENT_ADAPTER.validate_python(data)
+
+
 class UpdateDocumentRequest(BaseModel):
     """
     Модель валидации запроса для обновления документа.
@@ -523,14 +820,27 @@ class UpdateDocumentRequest(BaseModel):
         paraphrases: Список парафразов (вариаций вопроса)
     """
     service_id: int = Field(..., gt=0, description="ID сервиса, к которому принадлежит документ")
-    name: str = Field(None,  min_length=1, max_length=500, description="название документа")
-    question: str = Field(None, min_length=1, max_length=5000, description="основной вопрос документа")
-    answer: str = Field(None, min_length=1, max_length=10000, description="ответ на вопрос")
+    name: NameStr = Field(None, description="название документа")
+    question: TextStr = Field(None, description="основной вопрос документа")
+    answer: LongTextStr = Field(None, description="ответ на вопрос")
     status: _DocumentStatus = Field(None, description="статус документа")
     ext: Optional[Dict[str, Any]] = Field(None, description="дополнительные данные в формате JSON")
     paraphrases: Optional[List[_ParaphraseItem]] = Field(None, description="список парафразов (вариаций вопроса)")
 
-    
+    @classmethod
+    def fast_validate(cls, data: Dict[str, Any]) -> "UpdateDocumentRequest":
+        """
+        Валидация запроса через заранее собранный TypeAdapter.
+
+        Args:
+            data (Dict[str, Any]): Параметры запроса
+
+        Returns:
+            UpdateDocumentRequest: Провалидированный запрос
+        """
+        return _UPDATE_DOCUMENT_ADAPTER.validate_python(data)
+
+
 class DocumentAttachmentModel(BaseModel):
     name: str = Field(..., description="Название вложения")
     description: Optional[str] = Field(None, description="Описание вложения")
@@ -545,7 +855,7 @@ class _AnswerItem(BaseModel):
         text: Текст ответа
     """
     language: str = Field(..., min_length=1, max_length=10, description="язык ответа")
-    text: str = Field(..., min_length=1, description="текст ответа")
+    text: NonEmptyStr = Field(..., description="текст ответа")
     
 
 class _AttachmentItem(BaseModel):
@@ -558,7 +868,7 @@ class _AttachmentItem(BaseModel):
         description: Описание вложения
     """
     attachment_id: int = Field(..., ge=0, description="ID вложения")
-    name: str = Field(..., min_length=1, description="название вложения")
+    name: NonEmptyStr = Field(..., description="название вложения")
     description: Optional[str] = Field(default=None, description="описание вложения")
     
 
@@ -571,9 +881,9 @@ class _UserInfo(BaseModel):
         name: Имя пользователя
         email: Email пользователя
     """
-    id: str = Field(..., min_length=1, description="ID пользователя")
-    name: str = Field(..., min_length=1, description="имя пользователя")
-    email: str = Field(..., min_length=1, description="email пользователя")
+    id: NonEmptyStr = Field(..., description="ID пользователя")
+    name: NonEmptyStr = Field(..., description="имя пользователя")
+    email: NonEmptyStr = Field(..., description="email пользователя")
     
 
 class _ChangeItem(BaseModel):
@@ -584,7 +894,7 @@ class _ChangeItem(BaseModel):
         item: Название измененного элемента
         value: Новое значение
     """
-    item: str = Field(..., min_length=1, description="название измененного элемента")
+    item: NonEmptyStr = Field(..., description="название измененного элемента")
     value: str = Field(..., description="новое значение")
     
 
@@ -598,7 +908,7 @@ class _HistoryItem(BaseModel):
         user: Информация о пользователе
         changelist: Список изменений
     """
-    name: str = Field(..., min_length=1, description="название операции")
+    name: NonEmptyStr = Field(..., description="название операции")
     created_at: str = Field(..., description="время создания (ISO timestamp)")
     user: _UserInfo = Field(..., description="информация о пользователе")
     changelist: List[_ChangeItem] = Field(..., description="список изменений")
@@ -625,18 +935,18 @@ class DocumentContextModel(BaseModel):
         answers: Список ответов на разных языках
         history: История изменений документа
     """
-    name: str = Field(..., min_length=1, description="название документа")
-    question: str = Field(..., min_length=1, description="вопрос документа")
-    answer: str = Field(..., min_length=1, description="ответ документа")
+    name: NonEmptyStr = Field(..., description="название документа")
+    question: NonEmptyStr = Field(..., description="вопрос документа")
+    answer: NonEmptyStr = Field(..., description="ответ документа")
     status: _DocumentStatus = Field(..., description="статус документа")
     modified_at: str = Field(..., description="время изменения (ISO timestamp)")
     expired_at: Optional[str] = Field(default=None, description="время истечения (ISO timestamp)")
-    ext: Dict[str, Any] = Field(default_factory=dict, description="дополнительные данные")
+    ext: OpaqueDict = Field(default_factory=dict, description="дополнительные данные")
     paraphrases_count: int = Field(..., ge=0, description="количество парафразов")
     suggested_paraphrases_count: int = Field(..., ge=0, description="количество предложенных парафразов")
     paraphrases: List[_ParaphraseItem] = Field(..., description="список парафразов")
     attachments: List[_AttachmentItem] = Field(..., description="список вложений")
-    context: Dict[str, Any] = Field(default_factory=dict, description="контекстные данные")
+    context: OpaqueDict = Field(default_factory=dict, description="контекстные данные")
     answers: List[_AnswerItem] = Field(..., description="список ответов на разных языках")
     history: List[_HistoryItem] = Field(..., description="история изменений документа")
     
@@ -648,6 +958,7 @@ class DocumentTagsModel(BaseModel):
     Attributes:
         tags: Список тегов документа
     """
+    model_config = ConfigDict(extra='ignore', frozen=True, validate_assignment=False, str_strip_whitespace=True)
     tags: List[str] = Field(..., description="список тегов документа")
     
     
@@ -662,10 +973,11 @@ class CreateParaphraseModel(BaseModel):
         author: Автор парафраза
 
     """
+    model_config = ConfigDict(extra='ignore', frozen=True, validate_assignment=False, str_strip_whitespace=True)
     service_id: int = Field(..., gt=0, description="ID сервиса, к которому принадлежит документ")
     document_id: int = Field(..., gt=0, description="ID документа, для которого создается парафраз")
-    paraphrase: str = Field(..., min_length=1, max_length=5000, description="текст парафраза")
-    author: str = Field(..., min_length=1, max_length=255, description="автор парафраза")
+    paraphrase: TextStr = Field(..., description="текст парафраза")
+    author: ShortStr = Field(..., description="автор парафраза")
     
 
 class GetParaphrasesyParamsModel(BaseModel):
@@ -674,47 +986,44 @@ class GetParaphrasesyParamsModel(BaseModel):
     
     Attributes:
         document_id: ID документа (обязательный параметр)
-        limit_paraphrases: Ограничение на количество формулировок в ответе
-        offset_paraphrases: Смещение на выдачу формулировок в ответе
-        offset: Pagination offset (alias for offset_paraphrases, default 0)
-        count: Pagination count (alias for limit_paraphrases, default 9999)
+        offset: Смещение на выдачу формулировок в ответе (также принимается как offset_paraphrases, default 0)
+        count: Ограничение на количество формулировок в ответе (также принимается как limit_paraphrases, default 9999)
         sort_by: Поле для сортировки - 'id' или 'modified_at' (default 'id')
         sort_order: Порядок сортировки - 'asc' или 'desc' (default 'asc')
 
     """
     document_id: int = Field(..., gt=0, description="ID документа")
-    limit_paraphrases: Optional[int] = Field(default=None, ge=1, description="ограничение на количество формулировок в ответе")
-    offset_paraphrases: Optional[int] = Field(default=None, ge=0, description="смещение на выдачу формулировок в ответе")
-    offset: Optional[int] = Field(default=0, ge=0, description="pagination offset (default 0) (alias for offset_paraphrases)")
-    count: Optional[int] = Field(default=None, ge=1, description="pagination count (default 9999) (alias for limit_paraphrases)")
-    sort_by: Optional[str] = Field(default="id", description="sort by 'id' or 'modified_at' (default is 'id')")
+    offset: int = Field(default=0, ge=0, validation_alias=AliasChoices('offset', 'offset_paraphrases'), description="смещение на выдачу формулировок в ответе (default 0)")
+    count: int = Field(default=9999, ge=1, validation_alias=AliasChoices('count', 'limit_paraphrases'), description="ограничение на количество формулировок в ответе (default 9999)")
+    sort_by: Literal["id", "modified_at"] = Field(default="id", description="sort by 'id' or 'modified_at' (default is 'id')")
     sort_order: Literal["asc", "desc"] = Field(default="asc", description="sorting order 'asc' or 'desc' (default is 'asc')")
     
     
-class MassUpdateParaphraseItemModel(BaseModel):
+class UpdateParaphraseItemModel(BaseModel):
     """
     Модель элемента парафраза для обновления.
     
     Attributes:
-        paraphrase_id: ID парафраза для обновления
         text: Новый текст парафраза
         author: Автор парафраза
     """
-    paraphrase_id: int = Field(..., gt=0, description="ID парафраза для обновления")
-    text: str = Field(..., min_length=1, max_length=5000, description="новый текст парафраза")
-    author: str = Field(..., min_length=1, max_length=255, description="автор парафраза")
+    text: TextStr = Field(..., description="новый текст парафраза")
+    author: ShortStr = Field(..., description="автор парафраза")
     
 
-class UpdateParaphraseItemModel(BaseModel):
+class MassUpdateParaphraseItemModel(UpdateParaphraseItemModel):
     """
-    Модель элемента парафраза для обновления.
+    Модель элемента парафраза для массового обновления.
+    
+    Расширяет UpdateParaphraseItemModel идентификатором парафраза.
     
     Attributes:
+        paraphrase_id: ID парафраза для обновления
         text: Новый текст парафраза
         author: Автор парафраза
     """
-    text: str = Field(..., min_length=1, max_length=5000, description="новый текст парафраза")
-    author: str = Field(..., min_length=1, max_length=255, description="автор парафраза")
+    model_config = ConfigDict(extra='ignore', frozen=True, validate_assignment=False, str_strip_whitespace=True)
+    paraphrase_id: int = Field(..., gt=0, description="ID парафраза для обновления")
     
 
 class MassUpdateParaphrasesModel(BaseModel):
@@ -724,7 +1033,24 @@ class MassUpdateParaphrasesModel(BaseModel):
     Attributes:
         paraphrases: Список парафразов для обновления
     """
-    paraphrases: List[MassUpdateParaphraseItemModel] = Field(..., min_items=1, description="список парафразов для обновления")
+    paraphrases: List[MassUpdateParaphraseItemModel] = Field(..., min_length=1, description="список парафразов для обновления")
+
+    @classmethod
+    def from_trusted(cls, paraphrases: Iterable[Dict[str, Any]]) -> "MassUpdateParaphrasesModel":
+        """
+        Сборка запроса из доверенных парафразов без валидации.
+
+        Только для внутренних вызовов с уже провалидированными данными
+        (например, строками, полученными от API AutoFAQ). Пользовательский ввод
+        валидируется обычным конструктором.
+
+        Args:
+            paraphrases (Iterable[Dict[str, Any]]): Парафразы для обновления
+
+        Returns:
+            MassUpdateParaphrasesModel: Запрос со списком парафразов
+        """
+        return cls.model_construct(paraphrases=[MassUpdateParaphraseItemModel.model_construct(**p) for p in paraphrases])
     
     
 class MoveParaphraseItemModel(BaseModel):
@@ -737,8 +1063,9 @@ class MoveParaphraseItemModel(BaseModel):
         document_id: Исходный ID документа парафраза
         target_document_id: Целевой ID документа для перемещения
     """
+    model_config = ConfigDict(extra='ignore', frozen=True, validate_assignment=False, str_strip_whitespace=True)
     paraphrase_id: int = Field(..., gt=0, description="ID парафраза для перемещения")
-    text: str = Field(..., min_length=1, max_length=5000, description="текст парафраза")
+    text: TextStr = Field(..., description="текст парафраза")
     document_id: int = Field(..., gt=0, description="исходный ID документа парафраза")
     target_document_id: int = Field(..., gt=0, description="целевой ID документа для перемещения")
     
@@ -753,7 +1080,24 @@ class MassMoveParaphrasesModel(BaseModel):
     Attributes:
         paraphrases: Список парафразов для перемещения
     """
-    paraphrases: List[MoveParaphraseItemModel] = Field(..., min_items=1, description="список парафразов для перемещения")
+    paraphrases: List[MoveParaphraseItemModel] = Field(..., min_length=1, description="список парафразов для перемещения")
+
+    @classmethod
+    def from_trusted(cls, paraphrases: Iterable[Dict[str, Any]]) -> "MassMoveParaphrasesModel":
+        """
+        Сборка запроса из доверенных парафразов без валидации.
+
+        Только для внутренних вызовов с уже провалидированными данными
+        (например, строками, полученными от API AutoFAQ). Пользовательский ввод
+        валидируется обычным конструктором.
+
+        Args:
+            paraphrases (Iterable[Dict[str, Any]]): Парафразы для перемещения
+
+        Returns:
+            MassMoveParaphrasesModel: Запрос со списком парафразов
+        """
+        return cls.model_construct(paraphrases=[MoveParaphraseItemModel.model_construct(**p) for p in paraphrases])
     
     
 class GroupsListModel(BaseModel):
@@ -763,6 +1107,7 @@ class GroupsListModel(BaseModel):
     Attributes:
         services: Список ID сервисов для включения в группу
     """
+    model_config = ConfigDict(extra='ignore', frozen=True, validate_assignment=False, str_strip_whitespace=True)
     services: List[int] = Field(..., description="список ID сервисов для включения в группу")
 
 
@@ -775,7 +1120,7 @@ class CreateServiceTermModel(BaseModel):
         synonyms: Список синонимов для термина
         
     """
-    term: str = Field(..., min_length=1, max_length=255, description="основной термин")
+    term: ShortStr = Field(..., description="основной термин")
     synonyms: List[str] = Field(default_factory=list, description="список синонимов для термина")
     
     
@@ -788,5 +1133,10 @@ class CreateUserTermModel(BaseModel):
         synonyms: Список синонимов для термина
         
     """
-    term: str = Field(..., min_length=1, max_length=255, description="основной термин")
-    synonyms: List[str] = Field(default_factory=list, description="список синонимов для термина")
\ No newline at end of file
+    term: ShortStr = Field(..., description="основной термин")
+    synonyms: List[str] = Field(default_factory=list, description="список синонимов для термина")
+
+
+# Заранее собранные адаптеры для fast_validate запросов на запись документов
+_CREATE_DOCUMENT_ADAPTER: Final[TypeAdapter[CreateDocumentRequest]] = TypeAdapter(CreateDocumentRequest)
+_UPDATE_DOCUMENT_ADAPTER: Final[TypeAdapter[UpdateDocumentRequest]] = TypeAdapter(UpdateDocumentRequest)
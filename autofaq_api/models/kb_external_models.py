@@ -1,10 +1,64 @@
-from pydantic import BaseModel, Field, field_validator, ConfigDict, model_validator
-from typing import List, Optional, Literal
+from pydantic import BaseModel, Field, field_serializer, field_validator, ConfigDict, model_validator, WrapValidator, with_config
+from typing import Annotated, List, Optional, Literal, get_args
+from typing_extensions import TypedDict
 from datetime import datetime
-import uuid
+from enum import Enum
+from uuid import UUID
+import re
+from functools import lru_cache
+
+
+class Reason(str, Enum):
+    """Причины закрытия диалога."""
+    CLOSED_BY_BOT = 'ClosedByBot'
+    CLOSED_BY_OPERATOR = 'ClosedByOperator'
+    CLOSED_BY_OPERATOR_WITH_BOT = 'ClosedByOperatorWithBot'
+    CLOSED_BY_TIMER = 'ClosedByTimer'
+
 
 REASONS_LITERAL = Literal['ClosedByBot', 'ClosedByOperator', 'ClosedByOperatorWithBot', 'ClosedByTimer']
-STATUSES = ['ClosedByBot', 'ClosedByOperator', 'ClosedByOperatorWithBot', 'ClosedByTimer']
+STATUSES = get_args(REASONS_LITERAL)
+
+assert STATUSES == tuple(reason.value for reason in Reason), "REASONS_LITERAL и Reason должны перечислять одни и те же причины"
+
+DAYS_LITERAL = Literal['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+_TIME_RE = re.compile(r'(?:[01]?\d|2[0-3]):[0-5]\d:[0-5]\d', re.ASCII)
+
+# Дата уже в каноническом виде (UTC, день 01-28 - всегда корректна): парсинг не нужен.
+# Нулевые микросекунды isoformat() опускает, поэтому '.000000' идет через pydantic
+_ISO_UTC_FAST_RE = re.compile(
+    r'((?!0000)\d{4}-(?:0[1-9]|1[0-2])-(?:0[1-9]|1\d|2[0-8])'
+    r'T(?:[01]\d|2[0-3]):[0-5]\d:[0-5]\d(?:\.(?!0{6})\d{6})?)(?:Z|\+00:00)?',
+    re.ASCII
+)
+
+
+@lru_cache(maxsize=1024)
+def _norm_iso(v: str) -> Optional[str]:
+    """Каноническая строка ISO 8601 с суффиксом 'Z' или None, если строку должен разобрать pydantic (с кэшем по исходной строке)."""
+    match = _ISO_UTC_FAST_RE.fullmatch(v)
+    if match:
+        return match.group(1) + 'Z'
+    return None
+
+
+def _format_iso_z(v: datetime) -> str:
+    """Приведение даты к строке ISO 8601 с суффиксом 'Z'."""
+    iso = v.isoformat()
+    return (iso.rpartition('+')[0] or iso) + 'Z'
+
+
+def _validate_iso_z(v, handler):
+    """Канонические строки берутся из кэша без разбора pydantic, остальное - после стандартной валидации datetime."""
+    if isinstance(v, str):
+        normalized = _norm_iso(v)
+        if normalized is not None:
+            return normalized
+    return _format_iso_z(handler(v))
+
+
+IsoDateTime = Annotated[datetime, WrapValidator(_validate_iso_z)]
 
 class _ChannelUser(BaseModel):
     id: str = Field(..., description="ID пользователя")
@@ -12,43 +66,27 @@ class _ChannelUser(BaseModel):
     email: str = Field(..., description="Email пользователя")
     phone: str = Field(..., description="Телефон пользователя")
     fullName: str = Field(..., description="Полное имя пользователя")
-    payload: dict = Field(default={}, description="Дополнительные данные пользователя")
+    payload: dict = Field(default_factory=dict, description="Дополнительные данные пользователя")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
      
 class _Operator(BaseModel):
     email: str = Field(None, description="Email оператора")
     login: str = Field(None, description="Логин оператора")
     phone: str = Field(None, description="Телефон оператора")
     fullName: str = Field(None, description="Полное имя оператора")
-    payload: dict = Field(default={}, description="Дополнительные данные оператора")
+    payload: dict = Field(default_factory=dict, description="Дополнительные данные оператора")
     
 
 class QuestionModel(BaseModel):
-    dt: datetime = Field(..., description="Дата и время сообщения")
+    dt: IsoDateTime = Field(..., description="Дата и время сообщения")
     text: str = Field(..., description="Текст сообщения")
-    fileIds: List[str] = Field(default=[], description="Список ID файлов")
+    fileIds: List[UUID] = Field(default_factory=list, description="Список ID файлов")
     channelUser: _ChannelUser = Field(..., description="Информация о пользователе канала")
     
-    @field_validator('fileIds')
-    def validate_file_ids(cls, v):
-        try:
-            uuid.UUID(v)
-            return v
-        except ValueError:
-            raise ValueError(f"Invalid UUID format: {v}")
-
-    @field_validator('dt')
-    def validate_dt_format(cls, v):
-        if isinstance(v, str):
-            try:
-                return datetime.fromisoformat(v.replace('Z', '+00:00')).isoformat().split('+')[0]+'Z'
-            except ValueError:
-                raise ValueError("Invalid datetime format. Expected ISO 8601 format")
-        elif isinstance(v, datetime):
-            return v.isoformat().split('+')[0]+'Z'
-        return v
+    @field_serializer('fileIds')
+    def serialize_file_ids(self, v):
+        return [str(file_id) for file_id in v]
 
     # class Config:
     #     json_encoders = {
@@ -58,10 +96,12 @@ class QuestionModel(BaseModel):
     
     
 class CloseСonversationModel(BaseModel):
-    reason: REASONS_LITERAL = Field(default='ClosedByBot', description="Причина закрытия")
+    reason: Reason = Field(default=Reason.CLOSED_BY_BOT, validate_default=True, description="Причина закрытия")
     closeToAutofaqServiceId: int = Field(None, description="ID сервиса AutoFAQ")
     closeToAutofaqDocumentId: int = Field(None, description="ID документа AutoFAQ")
     operator: _Operator = Field(None, description="Информация об операторе")
+
+    model_config = ConfigDict(use_enum_values=True)
     
     
 class GetConversationsModel(BaseModel):
@@ -70,7 +110,7 @@ class GetConversationsModel(BaseModel):
     limit: Optional[int] = Field(50, ge=1, le=100, description="Лимит записей (1-100)")
     page: Optional[int] = Field(1, ge=1, description="Номер страницы")
     orderDirection: Optional[Literal["Asc", "Desc"]] = Field("Desc", description="Направление сортировки")
-    conversationStatusList: Optional[List[str]] = Field(None, description="Список статусов диалогов")
+    conversationStatusList: Optional[List[REASONS_LITERAL]] = Field(None, description="Список статусов диалогов")
     channelUserQuery: Optional[str] = Field(None, description="Поиск по пользователю канала")
     participatingOperatorList: Optional[List[str]] = Field(None, description="Список операторов")
     themeList: Optional[List[str]] = Field(None, description="Список тем")
@@ -82,13 +122,6 @@ class GetConversationsModel(BaseModel):
             if v <= values['tsFrom']:
                 raise ValueError('tsTo must be greater than tsFrom')
         return v
-
-    @field_validator('conversationStatusList')
-    def validate_conversation_status(cls, v):
-        for i in v:
-            if i not in STATUSES:
-                raise ValueError(f'Status must be one of: {", ".join(STATUSES)}')
-        return v
     
     
 class _Interval(BaseModel):
@@ -105,13 +138,17 @@ class _Interval(BaseModel):
 
 
 class _EveryWeekPlan(BaseModel):
-    daysOfWeek: List[Literal["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]] = Field(
-        ..., description="Дни недели"
-    )
-    time: str = Field(..., pattern=r'^([01]?[0-9]|2[0-3]):[0-5][0-9]:[0-5][0-9]$', description="Время в формате HH:MM:SS")
+    daysOfWeek: List[DAYS_LITERAL] = Field(..., description="Дни недели")
+    time: str = Field(..., description="Время в формате HH:MM:SS")
     timezone: str = Field(..., description="Часовой пояс")
 
     model_config = ConfigDict(from_attributes=True)
+
+    @field_validator('time')
+    def validate_time(cls, v):
+        if not _TIME_RE.fullmatch(v):
+            raise ValueError("Invalid time format. Expected HH:MM:SS")
+        return v
     
     
 class _Plan(BaseModel):
@@ -127,16 +164,14 @@ class _TextContent(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
-class _FilterItem(BaseModel):
-    userId: Optional[str] = Field(None, description="ID пользователя")
-    userFullName: Optional[str] = Field(None, description="Полное имя пользователя")
-    userPhone: Optional[str] = Field(None, description="Телефон пользователя")
-    userPayload_studentId: Optional[str] = Field(None, alias="userPayload.studentId", description="Student ID из payload")
-
-    model_config = ConfigDict(
-        from_attributes=True,
-        populate_by_name=True
-    )
+# Статический фильтр может содержать тысячи строк: валидируем их как словари,
+# без создания экземпляра модели на каждую строку
+@with_config(ConfigDict(populate_by_name=True))
+class _FilterItemTD(TypedDict, total=False):
+    userId: Optional[str]
+    userFullName: Optional[str]
+    userPhone: Optional[str]
+    userPayload_studentId: Annotated[Optional[str], Field(alias="userPayload.studentId", description="Student ID из payload")]
 
 
 class PostDelayedDeliveryModel(BaseModel):
@@ -151,7 +186,7 @@ class PostDelayedDeliveryModel(BaseModel):
     plan: _Plan = Field(None, description="План рассылки")
     text: _TextContent = Field(..., description="Текст сообщения")
     filterType: Literal["static", "dynamic",] = Field(..., description="Тип фильтра")
-    filter: List[_FilterItem] = Field(None, description="Фильтр пользователей")
+    filter: Optional[List[_FilterItemTD]] = Field(None, description="Фильтр пользователей")
 
     model_config = ConfigDict(
         from_attributes=True,
@@ -170,49 +205,26 @@ class VarModel(BaseModel):
     )
 
 class _DateRange(BaseModel):
-    from_: datetime = Field(..., alias="from")
-    to: datetime
-
-    class Config:
-        populate_by_name = True
-        
-    @field_validator('from_')
-    def validate_dt_format(cls, v, values):
-        if isinstance(v, str):
-            try:
-                return datetime.fromisoformat(v.replace('Z', '+00:00')).isoformat().split('+')[0]+'Z'
-            except ValueError:
-                raise ValueError("Invalid datetime format. Expected ISO 8601 format")
-        elif isinstance(v, datetime):
-            return v.isoformat().split('+')[0]+'Z'
-        return v
+    from_: IsoDateTime = Field(..., alias="from")
+    to: IsoDateTime
 
-    @field_validator('to')
-    def validate_to_date(cls, v, values):
-        if isinstance(v, str):
-            try:
-                return datetime.fromisoformat(v.replace('Z', '+00:00')).isoformat().split('+')[0]+'Z'
-            except ValueError:
-                raise ValueError("Invalid datetime format. Expected ISO 8601 format")
-        elif isinstance(v, datetime):
-            return v.isoformat().split('+')[0]+'Z'
-        return v
+    model_config = ConfigDict(populate_by_name=True)
     
     
 class ConversationsCountReportModel(BaseModel):
     dateRange: _DateRange = Field(..., description="Интервал времени")
     dateGrouping: Literal["ByDay", "ByWeek", "ByMonth", "ByYear"] = Field("ByWeek")
     additionalGrouping: Literal["ByGroup", "ByChannel", "ByOperator"] = Field("ByGroup")
-    knowledgeBases: list = Field(default=[])
-    documentTags: list = Field(default=[])
-    groups: list = Field(default=[])
-    filters: list = Field(default=[])
+    knowledgeBases: list = Field(default_factory=list)
+    documentTags: list = Field(default_factory=list)
+    groups: list = Field(default_factory=list)
+    filters: list = Field(default_factory=list)
 
 
 class OperatorsReportModel(BaseModel):
     dateRange: _DateRange = Field(..., description="Временной диапазон отчета")
-    operators: list = Field(default=[], description="Список операторов для фильтрации")
-    groups: list = Field(default=[], description="Список групп для фильтрации")
+    operators: list = Field(default_factory=list, description="Список операторов для фильтрации")
+    groups: list = Field(default_factory=list, description="Список групп для фильтрации")
     dateGrouping: Literal["ByDay", "ByWeek", "ByMonth", "ByYear"] = Field(
         "ByDay", 
         description="Группировка по дате"
@@ -221,4 +233,4 @@ class OperatorsReportModel(BaseModel):
         "ByGroup", 
         description="Дополнительная группировка"
     )
-    knowledgeBases: list = Field(default=[], description="Список баз знаний для фильтрации")
\ No newline at end of file
+    knowledgeBases: list = Field(default_factory=list, description="Список баз знаний для фильтрации")
\ No newline at end of file
@@ -1,16 +1,32 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from typing import List
 
+from ._compat import _FUNCTION_TYPES
+
 
 class QueryModel(BaseModel):
+    model_config = ConfigDict(extra='ignore', frozen=True, validate_assignment=False, str_strip_whitespace=True)
     service_id: str = Field(..., min_length=1)
     service_token: str = Field(..., min_length=1)
     query: str = Field(..., min_length=1)
     top_k: int = Field(default=3, ge=1)
     session_id: str = Field(default="")
-    intents: List[str] = Field(default=[])
+    intents: List[str] = Field(default_factory=list)
     context_document_id: int = Field(default=0, ge=0)
     lower_bound: int = Field(default=0, ge=0)
     
 class BatchQueryModel(BaseModel):
-    payload: List[QueryModel] = Field(..., min_items=1, max_items=100)
+    model_config = ConfigDict(extra='ignore', frozen=True, validate_assignment=False, str_strip_whitespace=True, ignored_types=_FUNCTION_TYPES)
+    payload: List[QueryModel] = Field(..., min_length=1, max_length=100)
+
+    def payload_json(self) -> bytes:
+        """
+        Сериализация списка запросов в тело пакетного запроса через pydantic-core.
+
+        Returns:
+            bytes: JSON-массив запросов для эндпоинта /query/batch
+        """
+        return _QUERY_LIST_ADAPTER.dump_json(self.payload)
+
+
+_QUERY_LIST_ADAPTER = TypeAdapter(List[QueryModel])
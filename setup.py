@@ -1,5 +1,26 @@
+import os
+
 from setuptools import setup, find_packages
 
+CYTHON_MODULES = [
+  'autofaq_api/models/_compat.py',
+  'autofaq_api/models/kb_crud_models.py',
+  'autofaq_api/models/kb_external_models.py',
+  'autofaq_api/models/kb_query_models.py',
+]
+
+
+def ext_modules():
+  # Сборка моделей через Cython включается явно: AUTOFAQ_API_CYTHONIZE=1 pip install .
+  if not os.environ.get('AUTOFAQ_API_CYTHONIZE'):
+    return []
+  from Cython.Build import cythonize
+  return cythonize(
+    CYTHON_MODULES,
+    language_level=3,
+    compiler_directives={'boundscheck': False, 'wraparound': False},
+  )
+
 
 def readme():
   with open('README.md', 'r', encoding='UTF-8') as f:
@@ -16,6 +37,7 @@ setup(
   long_description_content_type='text/markdown',
   url='https://github.com/azatkhafizov/autofaq-api',
   packages=find_packages(),
+  ext_modules=ext_modules(),
   install_requires=['aiohttp>=2.25.1', 'aiohttp>=3.12.13', 'aiofiles==24.1.0', 'requests-toolbelt==1.0.0', 'pydantic>=2.9.2'],
   classifiers=[
     'Programming Language :: Python :: 3.11',